@@ -394,6 +394,17 @@ class SplurgeError(Exception):
         """
         return self._context.copy()
 
+    @property
+    def context_size(self) -> int:
+        """Get the number of attached context entries.
+
+        Unlike ``len(get_all_context())``, this does not copy the context.
+
+        Returns:
+            Number of context keys.
+        """
+        return len(self._context)
+
     def has_context(self, key: str) -> bool:
         """Check if context key exists.
 
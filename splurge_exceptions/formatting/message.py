@@ -43,14 +43,14 @@ class ErrorMessageFormatter:
             lines.append(error.message)
 
         # Add context if requested and present
-        if include_context and error.get_all_context():
+        if include_context and error.context_size:
             lines.append("")
             lines.append("Context:")
             context_str = self.format_context(error.get_all_context())
             lines.append(context_str)
 
         # Add suggestions if requested and present
-        if include_suggestions and error.get_suggestions():
+        if include_suggestions and error.has_suggestions():
             lines.append("")
             lines.append("Suggestions:")
             suggestions_str = self.format_suggestions(error.get_suggestions())
@@ -4,10 +4,17 @@ Ensure Hypothesis runs with intended settings in all environments by
 programmatically registering/loading a CI profile. This avoids relying on
 pyproject.toml being discovered in environments where Hypothesis's pyproject
 lookup may be skipped.
+
+Shared fixtures:
+    formatter: Session-wide ErrorMessageFormatter. The formatter holds no
+        state, so a single instance is safe to reuse across tests.
 """
 
+import pytest
 from hypothesis import HealthCheck, settings
 
+from splurge_exceptions.formatting.message import ErrorMessageFormatter
+
 # Register a profile named 'ci' and load it so Hypothesis uses these values
 # during the test run. This mirrors the intended values in pyproject.toml.
 settings.register_profile(
@@ -17,3 +24,9 @@ settings.register_profile(
     suppress_health_check=[HealthCheck.too_slow],
 )
 settings.load_profile("ci")
+
+
+@pytest.fixture(scope="session")
+def formatter() -> ErrorMessageFormatter:
+    """Provide a shared ErrorMessageFormatter instance."""
+    return ErrorMessageFormatter()
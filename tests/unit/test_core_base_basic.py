@@ -27,15 +27,14 @@ def test_with_message_only():
     assert error.full_code == "test"
 
 
-def test_normalization_uppercase():
+@pytest.mark.parametrize(
+    "raw_code",
+    ["Invalid-Code", "invalid_code"],
+    ids=["uppercase", "underscores"],
+)
+def test_normalization(raw_code):
     """Test error code normalization."""
-    error = DummyException("Test", error_code="Invalid-Code")
-    assert error.error_code == "invalid-code"
-
-
-def test_normalization_underscores():
-    """Test underscore conversion."""
-    error = DummyException("Test", error_code="invalid_code")
+    error = DummyException("Test", error_code=raw_code)
     assert error.error_code == "invalid-code"
 
 
@@ -198,12 +198,9 @@ class TestMessageFormattingProperties:
         error_code=valid_error_codes() | st.none(),
     )
     @settings(max_examples=100)
-    def test_formatter_never_raises(self, message, error_code):
+    def test_formatter_never_raises(self, formatter, message, error_code):
         """Property: Message formatter never raises on any valid message."""
-        from splurge_exceptions import ErrorMessageFormatter
-
         error = SplurgeValueError(message, error_code=error_code)
-        formatter = ErrorMessageFormatter()
         result = formatter.format_error(error)
         assert isinstance(result, str)
         assert len(result) > 0
@@ -10,7 +10,6 @@ import sys
 import pytest
 
 from splurge_exceptions import SplurgeError, SplurgeSubclassError, SplurgeValueError, __version__
-from splurge_exceptions.formatting.message import ErrorMessageFormatter
 
 
 class TestModuleEntryPoint:
@@ -42,59 +41,26 @@ class TestModuleEntryPoint:
 class TestDomainValidation:
     """Tests for domain validation in base.py."""
 
-    def test_empty_domain_raises_error(self):
-        """Test that empty domain raises SplurgeSubclassError."""
+    @pytest.mark.parametrize(
+        ("domain", "match"),
+        [
+            ("", "cannot be empty"),
+            ("valid..invalid", "empty components"),
+            ("_invalid.component", "Invalid _domain"),
+            ("Invalid.Component", "Invalid _domain"),
+            ("123.456", "Invalid _domain"),
+            ("invalid-", "Invalid _domain"),
+        ],
+        ids=["empty", "empty-components", "invalid-component", "uppercase", "numbers-only", "ends-with-dash"],
+    )
+    def test_invalid_domain_raises_error(self, domain, match):
+        """Test that an invalid _domain raises SplurgeSubclassError on instantiation."""
 
-        class EmptyDomainError(SplurgeError):
-            _domain = ""
+        class InvalidDomainError(SplurgeError):
+            _domain = domain
 
-        with pytest.raises(SplurgeSubclassError, match="cannot be empty"):
-            EmptyDomainError("Error message")
-
-    def test_domain_with_empty_components_raises_error(self):
-        """Test that domain with empty dot-separated components raises error."""
-
-        class BadDomainError(SplurgeError):
-            _domain = "valid..invalid"
-
-        with pytest.raises(SplurgeSubclassError, match="empty components"):
-            BadDomainError("Error message")
-
-    def test_domain_with_invalid_component_format_raises_error(self):
-        """Test that domain with invalid component format raises error."""
-
-        class InvalidComponentError(SplurgeError):
-            _domain = "_invalid.component"
-
-        with pytest.raises(SplurgeSubclassError, match="Invalid _domain"):
-            InvalidComponentError("Error message")
-
-    def test_domain_with_uppercase_raises_error(self):
-        """Test that domain with uppercase letters raises error."""
-
-        class UppercaseDomainError(SplurgeError):
-            _domain = "Invalid.Component"
-
-        with pytest.raises(SplurgeSubclassError):
-            UppercaseDomainError("Error message")
-
-    def test_domain_with_numbers_only_invalid(self):
-        """Test that domain component with only numbers is invalid."""
-
-        class OnlyNumbersError(SplurgeError):
-            _domain = "123.456"
-
-        with pytest.raises(SplurgeSubclassError):
-            OnlyNumbersError("Error message")
-
-    def test_domain_ending_with_dash_invalid(self):
-        """Test that domain ending with dash is invalid."""
-
-        class DashEndError(SplurgeError):
-            _domain = "invalid-"
-
-        with pytest.raises(SplurgeSubclassError):
-            DashEndError("Error message")
+        with pytest.raises(SplurgeSubclassError, match=match):
+            InvalidDomainError("Error message")
 
 
 class TestContextManagement:
@@ -145,13 +111,24 @@ class TestContextManagement:
         assert error.has_context("exists") is True
         assert error.has_context("notexists") is False
 
+    def test_context_size(self):
+        """Test context_size counts attached context keys."""
+        error = SplurgeValueError("Error", error_code="test")
+
+        assert error.context_size == 0
+
+        error.attach_context(key="a", value=1)
+        error.attach_context(context_dict={"b": 2, "c": 3})
+
+        assert error.context_size == 3
+
     def test_clear_context(self):
         """Test clearing all context data."""
         error = SplurgeValueError("Error", error_code="test")
         error.attach_context(context_dict={"a": 1, "b": 2})
 
         error.clear_context()
-        assert error.get_all_context() == {}
+        assert not error.get_all_context()
 
     def test_context_method_chaining(self):
         """Test that context methods support chaining."""
@@ -160,7 +137,7 @@ class TestContextManagement:
         result = error.attach_context(key="a", value=1).attach_context(context_dict={"b": 2}).clear_context()
 
         assert result is error
-        assert error.get_all_context() == {}
+        assert not error.get_all_context()
 
 
 class TestSuggestionManagement:
@@ -257,7 +234,7 @@ class TestGetFullMessage:
 class TestFormattingEdgeCases:
     """Tests for error formatting edge cases."""
 
-    def test_formatter_handles_object_with_broken_str(self):
+    def test_formatter_handles_object_with_broken_str(self, formatter):
         """Test formatter handles objects with broken __str__."""
 
         class BrokenStr:
@@ -270,13 +247,12 @@ class TestFormattingEdgeCases:
         error = SplurgeValueError("Error", error_code="test")
         error.attach_context(key="broken", value=BrokenStr())
 
-        formatter = ErrorMessageFormatter()
         result = formatter.format_error(error, include_context=True)
 
         assert "broken" in result
         assert "<BrokenStr>" in result or "unrepresentable" in result
 
-    def test_formatter_handles_object_with_broken_repr(self):
+    def test_formatter_handles_object_with_broken_repr(self, formatter):
         """Test formatter handles objects with broken __repr__."""
 
         class BrokenRepr:
@@ -289,21 +265,18 @@ class TestFormattingEdgeCases:
         error = SplurgeValueError("Error", error_code="test")
         error.attach_context(key="broken", value=BrokenRepr())
 
-        formatter = ErrorMessageFormatter()
         result = formatter.format_error(error, include_context=True)
 
         assert "unrepresentable" in result
 
-    def test_format_context_with_empty_dict(self):
+    def test_format_context_with_empty_dict(self, formatter):
         """Test format_context with empty dictionary."""
-        formatter = ErrorMessageFormatter()
         result = formatter.format_context({})
 
         assert result == ""
 
-    def test_format_suggestions_with_empty_list(self):
+    def test_format_suggestions_with_empty_list(self, formatter):
         """Test format_suggestions with empty list."""
-        formatter = ErrorMessageFormatter()
         result = formatter.format_suggestions([])
 
         assert result == ""